@@ -265,6 +265,11 @@ class LicenseCog(commands.Cog):
         else:
             await self._send_helper_message(thread)
 
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        """成员离开服务器时，清除其在成员缓存中的条目。"""
+        invalidate_member_cache(payload.guild_id, payload.user.id)
+
     # --- 斜杠命令组 ---
     license_group = app_commands.Group(
         name=ACTIVE_COMMAND_CONFIG["group"]["name"],
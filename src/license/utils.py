@@ -1,13 +1,37 @@
 # --- 辅助函数 ---
 import asyncio
 import re
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence
 
 from discord import Thread, Guild, ui
 
 from src.license.constants import *
 from src.license.database import *
 
+# 正则表达式，用于匹配裸露的URL（已经是 Markdown 链接的除外）
+_URL_RE = re.compile(r'(?<!\]\()(https?://[^\s<>()]+)')
+
+
+def _link_replacer(match: re.Match) -> str:
+    """
+    一个自定义的替换函数，用于 `_URL_RE.sub`。
+    """
+    url = match.group(0)  # 获取完整的URL，例如 "https://example.com"
+
+    # 检查是否是 Discord 消息链接
+    if "discord.com/" in url:
+        # 对于 Discord 链接，使用固定的友好文本
+        link_text = "「点击查看 Discord 链接内容」"
+        return f"[{link_text}]({url})"
+    else:
+        # 对于其他链接，移除协议头作为显示文本（正则已保证以 http:// 或 https:// 开头）
+        # 同时移除尾部的斜杠，让显示更干净
+        link_text = (url[8:] if url[4] == 's' else url[7:]).removesuffix('/')
+        return f"[{link_text}]({url})"
+
 
 def _format_links_in_text(text: str) -> str:
     """
@@ -16,68 +40,66 @@ def _format_links_in_text(text: str) -> str:
     """
     if not text:
         return text
-
-    # 正则表达式，用于匹配裸露的URL
-    url_pattern = re.compile(r'(?<!\]\()(https?://[^\s<>()]+)')
-
-    def replacer(match: re.Match) -> str:
-        """
-        一个自定义的替换函数，用于 re.sub。
-        """
-        url = match.group(0)  # 获取完整的URL，例如 "https://example.com"
-
-        # 检查是否是 Discord 消息链接
-        if "discord.com/" in url:
-            # 对于 Discord 链接，使用固定的友好文本
-            link_text = "「点击查看 Discord 链接内容」"
-            return f"[{link_text}]({url})"
-        else:
-            # 对于其他链接，移除协议头作为显示文本
-            link_text = re.sub(r'^https?://', '', url)
-            # 移除尾部的斜杠，让显示更干净
-            if link_text.endswith('/'):
-                link_text = link_text[:-1]
-            return f"[{link_text}]({url})"
+    # 绝大多数字段（如“禁止”、“未设置”）根本不含链接，直接返回，省去一次正则扫描
+    if 'http' not in text:
+        return text
 
     # 使用 re.sub 并传入我们的自定义替换函数
-    return url_pattern.sub(replacer, text)
+    return _URL_RE.sub(_link_replacer, text)
+
+
+# 批量格式化时用于拼接各段文本的分隔符。
+# 它是 Unicode 段落分隔符，会被 `\s` 匹配，因此不会被URL正则吞进链接里。
+_BATCH_SEPARATOR = "\u2029"
+
+
+def _format_links_in_texts(texts: Sequence[Any]) -> Sequence[Any]:
+    """
+    `_format_links_in_text` 的批量版本：将多段文本拼接后只执行一次正则替换，再按分隔符拆分回去。
+    非字符串的值（如配置中的 None）原样返回，由 add_field 转换为字符串。
+    """
+    try:
+        raw = _BATCH_SEPARATOR.join(texts)
+    except TypeError:
+        # 含有非字符串值，无法拼接，改为逐段处理
+        return [_format_links_in_text(text) if isinstance(text, str) else text for text in texts]
+    if 'http' not in raw:
+        return texts
+    parts = _URL_RE.sub(_link_replacer, raw).split(_BATCH_SEPARATOR)
+    if len(parts) != len(texts):
+        # 文本本身就含有分隔符（极少见），拆分会错位，改为逐段处理
+        return [_format_links_in_text(text) for text in texts]
+    return parts
 
 
 def build_settings_embed(config: LicenseConfig) -> discord.Embed:
     """
     工厂函数：创建一个包含所有配置项及其详细解释的设置面板Embed。
     """
-    description_parts = []
-
-    # 1. 机器人总开关
     enabled_emoji = "✅ 启用" if config.bot_enabled else "❌ 禁用"
-    description_parts.append(f"**机器人总开关**: {enabled_emoji}")
-    description_parts.append(
-        "> 控制机器人在你发新帖时是否会自动出现。关闭后，你需要使用 `/内容授权 打开面板` 手动召唤我。"
-    )
-    description_parts.append("---")
-
-    # 2. 自动发布默认协议
     auto_post_emoji = "✅ 启用" if config.auto_post else "❌ 禁用"
-    description_parts.append(f"**自动发布默认协议**: {auto_post_emoji}")
-    description_parts.append(
-        "> 启用后，当机器人出现时，将直接尝试发布你的默认协议，而不会显示一系列交互按钮让你选择。"
-    )
-    description_parts.append("---")
-
-    # 3. 发布前二次确认
     confirm_emoji = "✅ 启用" if config.require_confirmation else "❌ 禁用"
-    description_parts.append(f"**发布前二次确认**: {confirm_emoji}")
-    description_parts.append(
-        "> 启用后，在发布任何协议前（包括自动发布），都会先让你预览并点击确认。"
-    )
 
-    description_parts.append("\n完成后，点击下方的“关闭面板”即可。（不关也行，保存是实时的，就是不够优雅，懂吧？）")
+    # 面板结构是固定的，直接用一个模板拼出完整描述
+    description = (
+        # 1. 机器人总开关
+        f"**机器人总开关**: {enabled_emoji}\n"
+        "> 控制机器人在你发新帖时是否会自动出现。关闭后，你需要使用 `/内容授权 打开面板` 手动召唤我。\n"
+        "---\n"
+        # 2. 自动发布默认协议
+        f"**自动发布默认协议**: {auto_post_emoji}\n"
+        "> 启用后，当机器人出现时，将直接尝试发布你的默认协议，而不会显示一系列交互按钮让你选择。\n"
+        "---\n"
+        # 3. 发布前二次确认
+        f"**发布前二次确认**: {confirm_emoji}\n"
+        "> 启用后，在发布任何协议前（包括自动发布），都会先让你预览并点击确认。\n"
+        "\n完成后，点击下方的“关闭面板”即可。（不关也行，保存是实时的，就是不够优雅，懂吧？）"
+    )
 
     # 使用我们现有的标准助手Embed框架来创建
     return create_helper_embed(
         title="⚙️ 机器人设置详解",
-        description="\n".join(description_parts),
+        description=description,
         color=discord.Color.blurple()
     )
 
@@ -105,22 +127,86 @@ async def safe_delete_original_response(interaction: discord.Interaction, sleep_
         pass  # 如果用户在此期间关闭了，也无妨
 
 
+# 正在进行中的 fetch_member 请求，键为 (guild_id, user_id)。
+# 同一用户的并发查询会共享同一个请求，避免重复调用 Discord API。
+_pending_fetches: dict[tuple[int, int], asyncio.Task] = {}
+
+# fetch_member 结果的短期缓存，值为 (过期时间, 成员)。
+# 用户在一次会话中反复点击按钮时，无需每次都重新请求 Discord API。
+_MEMBER_CACHE_TTL = 60
+_MEMBER_CACHE_MAXSIZE = 4096
+_member_cache: OrderedDict[tuple[int, int], tuple[float, Member]] = OrderedDict()
+
+
+def _get_cached_member(key: tuple[int, int]) -> Member | None:
+    entry = _member_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, member = entry
+    if expires_at <= time.monotonic():
+        del _member_cache[key]
+        return None
+    _member_cache.move_to_end(key)
+    return member
+
+
+def _cache_member(key: tuple[int, int], member: Member) -> None:
+    _member_cache[key] = (time.monotonic() + _MEMBER_CACHE_TTL, member)
+    _member_cache.move_to_end(key)
+    if len(_member_cache) > _MEMBER_CACHE_MAXSIZE:
+        _member_cache.popitem(last=False)  # 淘汰最久未使用的条目
+
+
+def invalidate_member_cache(guild_id: int, user_id: int) -> None:
+    """成员离开服务器时调用，移除其缓存的成员对象。"""
+    key = (guild_id, user_id)
+    _member_cache.pop(key, None)
+    # 同时注销进行中的请求：它的结果在成员离开后才返回，不能再写入缓存
+    _pending_fetches.pop(key, None)
+
+
+def _on_fetch_done(key: tuple[int, int], task: asyncio.Task) -> None:
+    # 只有仍登记在案的请求才写入缓存；期间被 invalidate_member_cache 注销的请求直接丢弃
+    if _pending_fetches.get(key) is not task:
+        return
+    del _pending_fetches[key]
+    if not task.cancelled() and task.exception() is None:
+        _cache_member(key, task.result())
+
+
+async def _fetch_member_coalesced(guild: Guild, user_id: int) -> Member | None:
+    key = (guild.id, user_id)
+    member = _get_cached_member(key)
+    if member is not None:
+        return member
+
+    task = _pending_fetches.get(key)
+    if task is None:
+        task = asyncio.create_task(guild.fetch_member(user_id))
+        _pending_fetches[key] = task
+        task.add_done_callback(lambda t: _on_fetch_done(key, t))
+    # 使用 shield，避免某个调用方被取消时连带取消其他调用方共享的请求
+    return await asyncio.shield(task)
+
+
 async def get_member_async_thread(thread: Thread, user_id: int) -> Member | None:
-    return thread.guild.get_member(user_id) or await thread.guild.fetch_member(user_id)
+    return await get_member_async_guild(thread.guild, user_id)
 
 
 async def get_member_async_guild(guild: Guild, user_id: int) -> Member | None:
-    return guild.get_member(user_id) or await guild.fetch_member(user_id)
+    return guild.get_member(user_id) or await _fetch_member_coalesced(guild, user_id)
 
 
 def get_member(thread: Thread, user_id: int) -> discord.Member:
     return thread.guild.get_member(user_id)
 
 
+@lru_cache(maxsize=8)
 def build_footer_text(signature: str) -> str:
     """
     统一的页脚文本构建器。
     它会自动附加统一的“宣传语”。
+    签名与命令配置在运行期间不会变化，因此结果会被缓存。
 
     Args:
         signature: 标识此 Embed 类型的签名，
@@ -134,9 +220,18 @@ def build_footer_text(signature: str) -> str:
     return f"{signature} | 如果按钮失效(服务器重启、超时)，请使用 `/{cmd_name} {cmd_name_panel}`"
 
 
+@lru_cache(maxsize=1)
+def _build_license_footer_text() -> str:
+    """最终协议 Embed 的默认页脚文本，同样只需构建一次。"""
+    cmd_name = ACTIVE_COMMAND_CONFIG["group"]["name"]
+    return f"{SIGNATURE_LICENSE} | 在自己的帖子里，使用 `/{cmd_name}` 来使用我吧！"
+
+
 async def safe_defer(interaction: discord.Interaction):
-    if not interaction.response.is_done():
+    try:
         await interaction.response.defer(ephemeral=True)
+    except discord.InteractionResponded:
+        pass  # 已经响应过了，无需再次 defer
 
 
 def get_available_cc_licenses() -> dict:
@@ -179,6 +274,78 @@ _CC_DISCLAIMER_TEXT = (
     "如果创作者在任何地方对本协议添加了**额外规则**，那么这份协议就不再是**标准CC协议**了。\n"
     "它会变成一份**“长得像CC协议的自定义协议”**，其中的CC链接仅用于解释基础条款。"
 )
+# 核心条款中可能包含 `{license_type}` 占位符的字段
+_PLACEHOLDER_KEYS = ("reproduce", "derive", "commercial")
+# 预先用协议名称替换好占位符的CC协议数据，避免每次发布时重复格式化
+_CC_LICENSES_BAKED = {
+    name: {
+        key: value.format(license_type=name) if key in _PLACEHOLDER_KEYS and isinstance(value, str) else value
+        for key, value in details.items()
+    }
+    for name, details in CC_LICENSES.items()
+}
+# 允许商用的CC协议 -> 对应的非商用(NC)版本，没有对应版本时为 None（需降级为自定义）
+# 例如: "CC BY 4.0" -> "CC BY-NC 4.0"
+#       "CC BY-SA 4.0" -> "CC BY-NC-SA 4.0"
+_CC_TO_NC: dict[str, Optional[str]] = {
+    name: (nc_name if (nc_name := name.replace("CC BY", "CC BY-NC")) in CC_LICENSES else None)
+    for name in CC_LICENSES
+    if "NC" not in name
+}
+# _CC_TO_NC 中查不到时的哨兵值，用于与“降级为自定义”的 None 区分
+_NOT_DOWNGRADABLE = object()
+# 宽度拉伸器，附加在页脚后以保证主Embed宽度
+# `\u2800` 是盲文空格
+_STRETCHER = ' ' + '\u2800' * 30
+
+
+@lru_cache(maxsize=64)
+def _license_template(license_type: str, is_software_license: bool, is_cc_license: bool) -> dict:
+    """
+    构建协议 Embed 中只取决于协议类型、与发布者无关的静态部分，并按协议类型缓存。
+    返回的字典会被反复复用，调用方不得修改其内容（字段需复制后再使用）。
+    """
+    if is_software_license:
+        sw_details = SOFTWARE_LICENSES[license_type]
+        return {
+            "license_line": f"\n本项目采用 **[{license_type}]({sw_details['url']})** 开源许可证。",
+            "type_field": {"name": "📄 协议类型", "value": f"**{license_type}** (软件)", "inline": False},
+            "attribution_name": "✒️ 版权归属",
+            "clause_fields": (
+                {"name": "📜 核心条款", "value": sw_details["full_text"], "inline": False},
+            ),
+            "appendix_description": _EFFECTIVENESS_RULES_TEXT,
+        }
+
+    if is_cc_license:
+        cc_details = _CC_LICENSES_BAKED[license_type]
+        reproduce, derive, commercial = _format_links_in_texts(
+            (
+                cc_details.get("reproduce", "未设置"),
+                cc_details.get("derive", "未设置"),
+                cc_details.get("commercial", "未设置"),
+            )
+        )
+        return {
+            "license_line": f"\n本内容采用 **[{license_type}]({cc_details['url']})** 国际许可协议进行许可。",
+            "type_field": {"name": "📄 协议类型", "value": f"**{license_type}**", "inline": False},
+            "attribution_name": "✒️ 作者署名",
+            "clause_fields": (
+                {"name": "🔁 二次传播", "value": reproduce, "inline": True},
+                {"name": "🎨 二次创作", "value": derive, "inline": True},
+                {"name": "💰 商业用途", "value": commercial, "inline": True},
+            ),
+            "appendix_description": _EFFECTIVENESS_RULES_TEXT + "\n\n\n" + _CC_DISCLAIMER_TEXT,
+        }
+
+    # 自定义协议：核心条款完全由用户填写，只能在发布时构建
+    return {
+        "license_line": "",
+        "type_field": {"name": "📄 协议类型", "value": "**自定义协议**", "inline": False},
+        "attribution_name": "✒️ 作者署名",
+        "clause_fields": (),
+        "appendix_description": _EFFECTIVENESS_RULES_TEXT,
+    }
 
 
 def build_license_embeds(
@@ -193,37 +360,34 @@ def build_license_embeds(
     """
     根据给定的配置对象和作者信息，构建一个支持完整Markdown附加条款的美观Embed。
     """
-    saved_details = config.license_details.copy()  # 使用副本以防修改原始配置对象
+    saved_details = config.license_details  # 只读，不会修改原始配置对象
     license_type = saved_details.get("type", "custom")
     is_cc_license = license_type in CC_LICENSES
     is_software_license = license_type in SOFTWARE_LICENSES
 
     warning_message = None  # 用于存储将要显示的警告信息
+    force_no_commercial = False  # 是否需要强制覆盖商业条款为“禁止”
 
     # --- 策略校验与自动降级逻辑 ---
     if not commercial_use_allowed:
+        # 预先计算好的NC版本；不可降级（非CC协议或本身已是NC）时为哨兵值
+        nc_version = _CC_TO_NC.get(license_type, _NOT_DOWNGRADABLE)
+
         # 1. 对自定义协议，强制覆盖商业条款
         if license_type == "custom":
-            saved_details["commercial"] = "禁止"
+            force_no_commercial = True
 
         # 2. 对CC协议，检查冲突并执行降级
-        elif license_type in CC_LICENSES and "NC" not in license_type:
+        elif nc_version is not _NOT_DOWNGRADABLE:
             original_license = license_type
-            # 尝试找到对应的NC版本
-            # 例如: "CC BY 4.0" -> "CC BY-NC 4.0"
-            #       "CC BY-SA 4.0" -> "CC BY-NC-SA 4.0"
-            potential_nc_version = license_type.replace("CC BY", "CC BY-NC")
 
-            if potential_nc_version in CC_LICENSES:
+            if nc_version is not None:
                 # 成功找到可降级的版本
-                license_type = potential_nc_version
-                saved_details["type"] = license_type
-                is_cc_license = True  # 保持同步
+                license_type = nc_version
             else:
                 # 如果找不到（例如对于 CC0 这种未来可能添加的），则降级为自定义
                 license_type = "custom"
-                saved_details["type"] = "custom"
-                saved_details["commercial"] = "禁止"
+                force_no_commercial = True
                 is_cc_license = False  # 已降级为自定义
 
             # 准备警告信息
@@ -234,99 +398,94 @@ def build_license_embeds(
             )
 
     # --- Embed 构建流程 ---
-    display_details = saved_details
-    # 如果降级了，就强制使用新协议的数据
-    if is_cc_license:
-        display_details.update(CC_LICENSES[license_type])
-    elif is_software_license:
-        display_details.update(SOFTWARE_LICENSES[license_type])
-
-    # --- 智能替换占位符 ---
-    # 定义在不同情况下的替换文本
-    placeholder_replacement = ""
-    if is_cc_license:
-        # 如果是标准的CC协议，用具体的协议名称替换
-        placeholder_replacement = license_type
+    # 标准协议（CC/软件）的条款取自缓存的模板（如果降级了，就是新协议的模板），
+    # 这里只会读取用户自己填写的字段（署名、附加条款、附言），无需复制
+    if is_cc_license or is_software_license:
+        display_details = saved_details
     else:
-        # 如果是自定义协议（包括从CC降级而来的），使用通用短语
-        placeholder_replacement = "相同的条款"
-
-    # 遍历核心条款，执行替换
-    for key in ["reproduce", "derive", "commercial"]:
-        if key in display_details and isinstance(display_details[key], str):
-            display_details[key] = display_details[key].format(license_type=placeholder_replacement)
+        display_details = saved_details.copy()  # 自定义协议需要一份副本，以便替换占位符
+        if force_no_commercial:
+            display_details["commercial"] = "禁止"
+        # 智能替换占位符：自定义协议（包括从CC降级而来的）使用通用短语
+        # （标准CC协议的占位符已在模块加载时替换为具体的协议名称）
+        for key in _PLACEHOLDER_KEYS:
+            if key in display_details and isinstance(display_details[key], str):
+                display_details[key] = display_details[key].format(license_type="相同的条款")
 
-    description_parts = []
-    description_parts.append(f"**发布者: ** {author.mention}")
+    # 与发布者无关的静态部分直接取自按协议类型缓存的模板
+    template = _license_template(license_type, is_software_license, is_cc_license)
 
-    if is_cc_license:
-        description_parts.append(f"本内容采用 **[{license_type}]({display_details['url']})** 国际许可协议进行许可。")
-    elif is_software_license:
-        description_parts.append(f"本项目采用 **[{license_type}]({display_details['url']})** 开源许可证。")
+    # 如果存在警告信息，将其添加到描述中（使用引用块使其更醒目）
+    warning_line = f"\n\n> {warning_message}" if warning_message else ""
 
-    # 如果存在警告信息，将其添加到描述中
-    if warning_message:
-        description_parts.append(f"\n> {warning_message}")  # 使用引用块使其更醒目
+    description = f"**发布者: ** {author.mention}{template['license_line']}{warning_line}"
 
     # 准备一个列表来存储最终要发送的所有Embed
     embeds_to_send: List[discord.Embed] = []
 
-    # 3. 创建 Embed 并组合描述
-    main_embed_title = title_override or "📜 内容授权协议"
-    main_embed = discord.Embed(
-        title=main_embed_title,
-        description="\n".join(description_parts) if description_parts else None,
-        color=discord.Color.gold() if not warning_message else discord.Color.orange()  # 警告时使用不同颜色
-    )
-
-    # 使用 set_author 来展示作者信息
-    # 这会在 Embed 的最顶部显示作者的头像和名字
-    main_embed.set_author(name=f"由 {author.display_name} ({author.name}) 发布", icon_url=author.display_avatar.url)
-
-    # 4. 添加结构化的核心条款字段
-    # --- 根据协议类型（内容/软件）填充不同的字段 ---
-    if is_software_license:
-        main_embed.add_field(name="📄 协议类型", value=f"**{license_type}** (软件)", inline=False)
-        main_embed.add_field(name="✒️ 版权归属", value=_format_links_in_text(display_details.get("attribution", "未设置")), inline=False)
-        main_embed.add_field(name="📜 核心条款", value=display_details["full_text"], inline=False)
-    else:  # 自定义或CC协议
-        if is_cc_license:
-            main_embed.add_field(name="📄 协议类型", value=f"**{license_type}**", inline=False)
-        else:
-            main_embed.add_field(name="📄 协议类型", value="**自定义协议**", inline=False)
-        main_embed.add_field(name="✒️ 作者署名", value=_format_links_in_text(display_details.get("attribution", "未设置")), inline=False)
-        main_embed.add_field(name="🔁 二次传播", value=_format_links_in_text(display_details.get("reproduce", "未设置")), inline=True)
-        main_embed.add_field(name="🎨 二次创作", value=_format_links_in_text(display_details.get("derive", "未设置")), inline=True)
-        main_embed.add_field(name="💰 商业用途", value=_format_links_in_text(display_details.get("commercial", "未设置")), inline=True)
+    # 3. 组装结构化的核心条款字段
+    attribution_field = {
+        "name": template["attribution_name"],
+        "value": display_details.get("attribution", "未设置"),
+        "inline": False,
+    }
+    linked_fields = [attribution_field]  # 需要在发布时美化链接的字段
+    if is_cc_license or is_software_license:
+        # add_field 会复制字段内容，模板中共享的字段可以直接使用
+        clause_fields: Sequence[dict] = template["clause_fields"]
+    else:  # 自定义协议
+        clause_fields = (
+            {"name": "🔁 二次传播", "value": display_details.get("reproduce", "未设置"), "inline": True},
+            {"name": "🎨 二次创作", "value": display_details.get("derive", "未设置"), "inline": True},
+            {"name": "💰 商业用途", "value": display_details.get("commercial", "未设置"), "inline": True},
+        )
+        linked_fields.extend(clause_fields)
+    fields = [template["type_field"], attribution_field, *clause_fields]
 
     # 附加条款
     if not is_cc_license:
         notes = display_details.get("notes")
         if notes and notes.strip() and notes != "无":
-            # 注意：add_field 的 value 不支持复杂的 Markdown，但简单的链接可以
-            main_embed.add_field(name="📝 附加条款 (如无另外声明，其效力范围同本协议)", value=_format_links_in_text(notes), inline=False)
+            # 注意：字段的 value 不支持复杂的 Markdown，但简单的链接可以
+            notes_field = {"name": "📝 附加条款 (如无另外声明，其效力范围同本协议)", "value": notes, "inline": False}
+            fields.append(notes_field)
+            linked_fields.append(notes_field)
 
-    # 添加宽度拉伸器，保证主Embed宽度
-    # `\uu2800` 是盲文空格
-    stretcher_value = ' ' + '\u2800' * 30
+    # 所有需要美化链接的字段合并为一次正则替换
+    formatted_values = _format_links_in_texts([field["value"] for field in linked_fields])
+    for field, value in zip(linked_fields, formatted_values):
+        field["value"] = value
 
-    # 设置页脚
-    cmd_name = ACTIVE_COMMAND_CONFIG["group"]["name"]
-    footer_text = footer_override or SIGNATURE_LICENSE+f" | 在自己的帖子里，使用 `/{cmd_name}` 来使用我吧！"
-    main_embed.set_footer(text=footer_text + stretcher_value)
+    # 4. 创建主 Embed
+    main_embed = discord.Embed(
+        title=title_override or "📜 内容授权协议",
+        description=description,
+        # 警告时使用不同颜色
+        color=discord.Color.gold() if not warning_message else discord.Color.orange()
+    )
+
+    # 使用 set_author 来展示作者信息
+    # 这会在 Embed 的最顶部显示作者的头像和名字
+    main_embed.set_author(
+        name=f"由 {author.display_name} ({author.name}) 发布",
+        icon_url=author.display_avatar.url
+    )
+
+    for field in fields:
+        main_embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
+
+    # 设置页脚，并附加宽度拉伸器
+    footer_text = footer_override or _build_license_footer_text()
+    main_embed.set_footer(text=footer_text + _STRETCHER)
 
     embeds_to_send.append(main_embed)
 
     # --- 按需构建附录并返回 ---
     # 添加“协议生效规则”字段
     if include_appendix:
-        appendix_description_parts = [_EFFECTIVENESS_RULES_TEXT]
-        if is_cc_license:
-            appendix_description_parts.append("\n\n" + _CC_DISCLAIMER_TEXT)
-
         appendix_embed = discord.Embed(
             title="⚖️ 协议生效规则",
-            description="\n".join(appendix_description_parts),
+            description=template["appendix_description"],
             color=discord.Color.light_grey()
         )
 
@@ -351,7 +510,7 @@ def build_license_embeds(
             color=discord.Color.blue()
         )
         # 保持页脚一致性
-        # postscript_embed.set_footer(text=footer_text + stretcher_value)
+        # postscript_embed.set_footer(text=footer_text + _STRETCHER)
         embeds_to_send.append(postscript_embed)
 
     return embeds_to_send
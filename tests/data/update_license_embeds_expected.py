@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+重新生成 license_embeds_expected.json 快照
+以当前 src.license.utils.build_license_embeds 的输出为准，仅在有意修改协议 Embed 的展示内容后运行：
+
+    python tests/data/update_license_embeds_expected.py
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.license import utils
+from tests.test_license_utils import _EXPECTED_EMBEDS_PATH, FakeAuthor, license_embed_cases
+
+
+def main():
+    """按测试用例逐个构建 Embed 并写入快照文件"""
+    snapshot = {}
+    for case_id, (details, commercial_use_allowed) in license_embed_cases():
+        config = SimpleNamespace(license_details=dict(details))
+        embeds = utils.build_license_embeds(config, FakeAuthor(), commercial_use_allowed)
+        snapshot[case_id] = [embed.to_dict() for embed in embeds]
+
+    with open(_EXPECTED_EMBEDS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"已写入 {len(snapshot)} 个用例到 {_EXPECTED_EMBEDS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
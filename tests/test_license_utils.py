@@ -0,0 +1,266 @@
+"""
+授权协议助手工具函数测试
+测试链接格式化等辅助函数的行为
+"""
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from discord import ui
+
+from src.license import utils
+
+
+class TestFormatLinks:
+    """测试链接格式化函数"""
+
+    def test_format_single_text(self):
+        """测试单段文本中的裸露URL被转换为Markdown链接"""
+        expected = "见 [example.com](https://example.com/)"
+        assert utils._format_links_in_text("见 https://example.com/") == expected
+        assert utils._format_links_in_text("http://a.b/c") == "[a.b/c](http://a.b/c)"
+        assert utils._format_links_in_text("[x](https://example.com)") == "[x](https://example.com)"
+        assert utils._format_links_in_text("禁止") == "禁止"
+        assert utils._format_links_in_text("") == ""
+
+    def test_discord_link(self):
+        """测试 Discord 链接使用固定的友好文本"""
+        url = "https://discord.com/channels/1/2/3"
+        assert utils._format_links_in_text(url) == f"[「点击查看 Discord 链接内容」]({url})"
+
+    @pytest.mark.parametrize("texts", [
+        ["by https://a.com/", "禁止", "see http://b.org/x"],
+        ["https://a.com", "https://b.com/"],
+        ["未设置", "无", "禁止"],
+        ["", "https://a.com/", ""],
+        ["https://discord.com/x", "[y](https://c.net)"],
+    ])
+    def test_batch_matches_per_field(self, texts):
+        """测试批量格式化与逐段格式化结果一致，且字段结尾的URL不会吞掉后续字段"""
+        expected = [utils._format_links_in_text(t) for t in texts]
+        assert list(utils._format_links_in_texts(texts)) == expected
+
+    def test_batch_text_containing_separator(self):
+        """测试文本本身含有分隔符时回退为逐段处理"""
+        texts = [f"a{utils._BATCH_SEPARATOR}https://a.com/", "https://b.com/"]
+        expected = [utils._format_links_in_text(t) for t in texts]
+        assert list(utils._format_links_in_texts(texts)) == expected
+
+
+    def test_batch_non_str_values_pass_through(self):
+        """测试非字符串的值（如 None）原样保留，其余字段照常格式化"""
+        texts = [None, "https://a.com/", 5, "禁止"]
+        expected = [None, "[a.com](https://a.com/)", 5, "禁止"]
+        assert list(utils._format_links_in_texts(texts)) == expected
+
+    def test_none_field_renders_as_text(self):
+        """测试自定义协议中为 None 的字段仍按原行为显示为 "None" """
+        details = dict(_DETAIL_VARIANTS["links"], type="custom", derive=None)
+        config = SimpleNamespace(license_details=details)
+        main_embed = utils.build_license_embeds(config, FakeAuthor(), True)[0]
+        values = {field.name: field.value for field in main_embed.fields}
+        assert values["🎨 二次创作"] == "None"
+        assert values["🔁 二次传播"].endswith("[r.example.com](https://r.example.com/)")
+
+
+class TestGetItemById:
+    """测试按 custom_id 查找视图组件"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_and_rebuild(self):
+        """测试子组件增删（数量不变）后仍能找到正确的组件"""
+        view = ui.View()
+        a = ui.Button(custom_id="a")
+        b = ui.Button(custom_id="b")
+        view.add_item(a)
+        view.add_item(b)
+        assert utils.get_item_by_id(view, "a") is a
+        assert utils.get_item_by_id(view, "missing") is None
+
+        # 移除一个再添加一个，数量不变
+        c = ui.Button(custom_id="c")
+        view.remove_item(a)
+        view.add_item(c)
+        assert utils.get_item_by_id(view, "a") is None
+        assert utils.get_item_by_id(view, "c") is c
+
+        # clear_items 后以相同数量重建
+        view.clear_items()
+        d = ui.Button(custom_id="d")
+        e = ui.Button(custom_id="e")
+        view.add_item(d)
+        view.add_item(e)
+        assert utils.get_item_by_id(view, "b") is None
+        assert utils.get_item_by_id(view, "d") is d
+
+    @pytest.mark.asyncio
+    async def test_duplicate_custom_id_returns_first(self):
+        """测试 custom_id 重复时返回第一个组件"""
+        view = ui.View()
+        first = ui.Button(custom_id="dup")
+        second = ui.Select(custom_id="dup")
+        view.add_item(first)
+        view.add_item(second)
+        assert utils.get_item_by_id(view, "dup") is first
+
+
+class FakeGuild:
+    """模拟 Guild：成员缓存永远未命中，fetch_member 可被挂起并统计调用次数"""
+
+    def __init__(self, guild_id: int = 1):
+        self.id = guild_id
+        self.fetch_count = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def get_member(self, user_id: int):
+        return None
+
+    async def fetch_member(self, user_id: int):
+        self.fetch_count += 1
+        await self.release.wait()
+        return f"member-{user_id}"
+
+
+class TestMemberFetchCache:
+    """测试 fetch_member 的并发合并与 TTL/LRU 缓存"""
+
+    @pytest.fixture(autouse=True)
+    def clear_state(self):
+        """每个测试前后清空模块级缓存"""
+        utils._member_cache.clear()
+        utils._pending_fetches.clear()
+        yield
+        utils._member_cache.clear()
+        utils._pending_fetches.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        """测试并发调用只触发一次 fetch_member"""
+        guild = FakeGuild()
+        guild.release.clear()
+        callers = [asyncio.create_task(utils.get_member_async_guild(guild, 5)) for _ in range(10)]
+        await asyncio.sleep(0)
+        guild.release.set()
+        results = await asyncio.gather(*callers)
+        assert results == ["member-5"] * 10
+        assert guild.fetch_count == 1
+        assert not utils._pending_fetches
+
+    @pytest.mark.asyncio
+    async def test_cached_member_reused_until_expiry(self, monkeypatch):
+        """测试缓存命中时不再请求，过期后重新请求"""
+        guild = FakeGuild()
+        await utils.get_member_async_guild(guild, 5)
+        await utils.get_member_async_guild(guild, 5)
+        assert guild.fetch_count == 1
+
+        monkeypatch.setattr(utils, "_MEMBER_CACHE_TTL", 0)
+        utils._member_cache.clear()
+        await utils.get_member_async_guild(guild, 5)  # 以 TTL=0 写入，立即过期
+        await utils.get_member_async_guild(guild, 5)
+        assert guild.fetch_count == 3
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, monkeypatch):
+        """测试超过容量时淘汰最久未使用的条目"""
+        monkeypatch.setattr(utils, "_MEMBER_CACHE_MAXSIZE", 2)
+        guild = FakeGuild()
+        for user_id in (1, 2, 3):
+            await utils.get_member_async_guild(guild, user_id)
+        assert list(utils._member_cache) == [(1, 2), (1, 3)]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_entry(self):
+        """测试 invalidate_member_cache 移除缓存条目"""
+        guild = FakeGuild()
+        await utils.get_member_async_guild(guild, 5)
+        utils.invalidate_member_cache(guild.id, 5)
+        assert (guild.id, 5) not in utils._member_cache
+        await utils.get_member_async_guild(guild, 5)
+        assert guild.fetch_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch_is_not_cached(self):
+        """测试请求进行中被注销时，迟到的结果不会写入缓存"""
+        guild = FakeGuild()
+        guild.release.clear()
+        caller = asyncio.create_task(utils.get_member_async_guild(guild, 5))
+        await asyncio.sleep(0)
+        utils.invalidate_member_cache(guild.id, 5)
+        guild.release.set()
+        assert await caller == "member-5"
+        assert (guild.id, 5) not in utils._member_cache
+        assert not utils._pending_fetches
+
+
+class FakeAuthor:
+    """模拟发布协议的成员"""
+    id = 42
+    mention = "<@42>"
+    display_name = "作者"
+    name = "author"
+    display_avatar = SimpleNamespace(url="https://cdn.example.com/avatar.png")
+
+
+# 用户填写的两组协议详情：一组在字段结尾带有链接，一组为常见的无链接默认值
+_DETAIL_VARIANTS = {
+    "links": {
+        "attribution": "署名请链接到 https://a.example.com/",
+        "reproduce": "允许转载，需采用({license_type}) https://r.example.com/",
+        "derive": "允许二创 http://d.example.com",
+        "commercial": "允许",
+        "notes": "详见 https://discord.com/channels/1/2/3 和 https://n.example.com/",
+        "personal_statement": "欢迎交流",
+    },
+    "plain": {
+        "attribution": "需保留原作者署名",
+        "reproduce": "",
+        "derive": "",
+        "commercial": "禁止",
+        "notes": "无",
+        "personal_statement": "无",
+    },
+}
+
+
+def license_embed_cases():
+    """枚举所有 CC/软件/自定义协议 × 是否允许商用 × 详情组合"""
+    license_types = list(utils.CC_LICENSES) + list(utils.SOFTWARE_LICENSES) + ["custom"]
+    for license_type in license_types:
+        for commercial_use_allowed in (True, False):
+            for variant, details in _DETAIL_VARIANTS.items():
+                commercial = 'commercial' if commercial_use_allowed else 'non-commercial'
+                case_id = f"{license_type}|{commercial}|{variant}"
+                yield case_id, (dict(details, type=license_type), commercial_use_allowed)
+
+
+_EXPECTED_EMBEDS_PATH = Path(__file__).parent / "data" / "license_embeds_expected.json"
+
+
+@pytest.fixture(scope="module")
+def expected():
+    """加载协议 Embed 的预期输出快照（由 tests/data/update_license_embeds_expected.py 生成）"""
+    with open(_EXPECTED_EMBEDS_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestBuildLicenseEmbeds:
+    """测试协议 Embed 的构建结果与预期（原实现生成的快照）完全一致"""
+
+    @pytest.mark.parametrize("case_id,case", list(license_embed_cases()))
+    def test_embeds_match_snapshot(self, expected, case_id, case):
+        """测试每种协议在允许/禁止商用时的 Embed 输出"""
+        details, commercial_use_allowed = case
+        config = SimpleNamespace(license_details=dict(details))
+        embeds = utils.build_license_embeds(config, FakeAuthor(), commercial_use_allowed)
+        assert [embed.to_dict() for embed in embeds] == expected[case_id]
+        # 原始配置不应被修改
+        assert config.license_details == details